@@ -0,0 +1,40 @@
+"""Generate task ids server-side as native uuid
+
+Revision ID: 5b1e9c7d2a43
+Revises: ff2c013098bc
+Create Date: 2026-10-15 10:12:04.318276
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e9c7d2a43'
+down_revision: Union[str, Sequence[str], None] = 'ff2c013098bc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS "pgcrypto"')
+    op.alter_column('task', 'id',
+               existing_type=sa.VARCHAR(),
+               type_=postgresql.UUID(as_uuid=True),
+               existing_nullable=False,
+               postgresql_using='id::uuid',
+               server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('task', 'id',
+               existing_type=postgresql.UUID(as_uuid=True),
+               type_=sa.VARCHAR(),
+               existing_nullable=False,
+               postgresql_using='id::text',
+               server_default=None)
@@ -1,21 +1,34 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import make_url, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 from typing import AsyncGenerator
-from os import getenv
-
-from dotenv import load_dotenv
-
-load_dotenv()
+from app.settings import settings
 
 # Database URL (replace with your PostgreSQL credentials)
-DATABASE_URL = getenv("DATABASE_URL")
-
-# Create async engine
-engine = create_async_engine(DATABASE_URL, echo=True)
+DATABASE_URL = settings.database_url
+
+# asyncpg-only connection options; other drivers reject these keys
+connect_args = {}
+if make_url(DATABASE_URL).get_driver_name() == "asyncpg":
+    connect_args = {
+        "server_settings": {"jit": "off", "application_name": "task-mgr"},
+        "command_timeout": 60,
+    }
+
+# Create async engine with an explicitly sized connection pool
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_timeout=30,
+    connect_args=connect_args,
+)
 
 # Async session factory
-async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+async_session = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
 
 
 # Dependency to provide session
@@ -28,3 +41,9 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+
+
+# Cheap connectivity check used on startup instead of create_all
+async def check_db():
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
@@ -1,13 +1,24 @@
 from datetime import datetime
 from typing import Dict, Optional
+from uuid import UUID
+from sqlalchemy import Column, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.mutable import MutableDict
 from sqlmodel import SQLModel, Field, JSON
 from app.models.status import Status
-from app.utils.uuid import generate_uuid
 
 
 class Task(SQLModel, table=True):
-    id: str = Field(primary_key=True, default_factory=generate_uuid)
+    # Generated by Postgres on INSERT and fetched back on flush
+    id: Optional[UUID] = Field(
+        default=None,
+        sa_column=Column(
+            PG_UUID(as_uuid=True),
+            primary_key=True,
+            server_default=text("gen_random_uuid()"),
+        ),
+    )
     status: Status = Field(default=Status.TODO)
     input: Dict = Field(default_factory=dict, sa_type=JSON)
-    output: Optional[Dict] = Field(default=None, sa_type=JSON)
+    output: Optional[Dict] = Field(default=None, sa_type=MutableDict.as_mutable(JSON))
     created_at: datetime = Field(default_factory=datetime.now)
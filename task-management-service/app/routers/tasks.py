@@ -0,0 +1,144 @@
+from fastapi import APIRouter, Depends, HTTPException, Header, status
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+from google.cloud.pubsub_v1.publisher.exceptions import FlowControlLimitError
+import asyncio
+import hmac
+import orjson
+import logging
+from app.db.db import get_session
+from app.models.status import Status
+from app.models.task import Task
+from app.services.pubsub import PubSub, get_pubsub
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+API_KEY_BYTES = settings.api_key.encode()
+
+
+# Function-based middleware dependency for API key authentication
+async def verify_api_key(authorization: Optional[str] = Header(None)) -> str:
+    """
+    Verify API key from Authorization header.
+    Expected format: Bearer <api_key>
+    """
+    if not authorization:
+        raise HTTPException(status_code=401, detail="Missing Authorization header")
+
+    # strip() returns the same string when there is nothing to trim, and keeps
+    # accepting the extra or trailing whitespace that split() used to allow
+    token = authorization[7:].strip()
+    if authorization[:7].lower() != "bearer " or not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid Authorization header format. Expected 'Bearer <token>'",
+        )
+
+    if not hmac.compare_digest(token.encode(), API_KEY_BYTES):
+        raise HTTPException(status_code=403, detail="Invalid API key")
+
+    return token
+
+
+router = APIRouter(prefix="/api/tasks", dependencies=[Depends(verify_api_key)])
+
+
+# Models
+
+
+class TaskReq(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    heading: str
+
+
+class TaskUpdateReq(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    task_id: str
+    update: dict[str, Any]
+
+
+class TaskResp(BaseModel):
+    id: UUID
+    status: Status
+    input: dict[str, Any]
+    output: Optional[dict[str, Any]]
+    created_at: datetime
+
+
+@router.post("")
+async def post_task(
+    task_req: TaskReq,
+    session: AsyncSession = Depends(get_session),
+    pubsub_client: PubSub = Depends(get_pubsub),
+) -> Task:
+    task = Task(input={"heading": task_req.heading})
+    session.add(task)
+    await session.flush()
+    payload = orjson.dumps(task.model_dump(mode="json"))
+    # The message is published before the commit lands, so a fast consumer can
+    # briefly get a 404 for this task id. The timeout bounds how long the pooled
+    # connection stays idle in transaction; a publish that times out may still be
+    # delivered later for a task that was rolled back.
+    try:
+        result = await asyncio.wait_for(
+            pubsub_client.publish_msg(payload),
+            timeout=settings.pubsub_publish_timeout,
+        )
+    except (FlowControlLimitError, TimeoutError):
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Task queue is unavailable, try again later",
+        )
+    except Exception:
+        # Don't leave an orphaned task row when the pipeline never hears about it
+        await session.rollback()
+        raise
+    await session.commit()
+    logger.info("message-id %s", result)
+    return task
+
+
+@router.get("/{task_id}")
+async def get_task(
+    task_id: UUID, session: AsyncSession = Depends(get_session)
+) -> TaskResp:
+    # Read plain columns to skip ORM hydration on the read-only path
+    statement = select(
+        Task.id, Task.status, Task.input, Task.output, Task.created_at
+    ).where(Task.id == task_id)
+    result = await session.execute(statement)
+    row = result.mappings().first()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+        )
+    return TaskResp.model_validate(dict(row))
+
+
+@router.put("/{task_id}")
+async def put_task(
+    task_id: UUID,
+    task_req: TaskUpdateReq,
+    session: AsyncSession = Depends(get_session),
+) -> Task:
+    task = await session.get(Task, task_id)
+
+    if task is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+        )
+
+    if task.output is None:
+        task.output = {}
+    task.output.update(task_req.update)
+    await session.commit()
+    return task
@@ -1,32 +1,48 @@
-import json
-from typing import Dict
+import asyncio
+from fastapi import Request
 from google.cloud import pubsub_v1
+from google.cloud.pubsub_v1.types import LimitExceededBehavior
 from app.settings import settings
 
-publisher = pubsub_v1.PublisherClient()
-subscriber = pubsub_v1.SubscriberClient()
-
 
 class PubSub:
     topic_name: str
     subscription_name: str
+    publisher: pubsub_v1.PublisherClient
+    subscriber: pubsub_v1.SubscriberClient
 
     def __init__(self):
         self.topic_name = settings.gcp_pubsub_topic
         self.subscription_name = settings.gcp_pubsub_subscription
-
-    async def publish_msg(self, msg: Dict):
-        msg_bytes = json.dumps(msg).encode("utf-8")
-        future = publisher.publish(self.topic_name, msg_bytes)
-        return future.result()
+        self.publisher = pubsub_v1.PublisherClient(
+            publisher_options=pubsub_v1.types.PublisherOptions(
+                enable_message_ordering=False,
+                flow_control=pubsub_v1.types.PublishFlowControl(
+                    message_limit=10000,
+                    byte_limit=10 * 1024 * 1024,
+                    limit_exceeded_behavior=LimitExceededBehavior.ERROR,
+                ),
+            ),
+        )
+        self.subscriber = pubsub_v1.SubscriberClient()
+
+    async def publish_msg(self, msg_bytes: bytes):
+        # Over the flow-control limit the future fails with FlowControlLimitError
+        # instead of publish() blocking the event loop
+        future = self.publisher.publish(self.topic_name, msg_bytes)
+        return await asyncio.wrap_future(future)
 
     async def pull_msg(self):
-        resp = subscriber.pull(subscription=self.subscription_name, max_messages=1)
+        resp = await asyncio.to_thread(
+            self.subscriber.pull, subscription=self.subscription_name, max_messages=1
+        )
         return resp.received_messages
 
-
-pubsub_client = PubSub()
+    def close(self):
+        # Flush pending batches and release the gRPC channels
+        self.publisher.stop()
+        self.subscriber.close()
 
 
-async def get_pubsub():
-    return pubsub_client
+async def get_pubsub(request: Request) -> PubSub:
+    return request.app.state.pubsub
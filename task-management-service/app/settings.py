@@ -1,6 +1,11 @@
+from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
 from typing import Optional
 
+# Load .env into os.environ once for the whole app, so libraries that read the
+# environment directly (e.g. GOOGLE_APPLICATION_CREDENTIALS) see it as well.
+load_dotenv()
+
 
 class Settings(BaseSettings):
     """Application configuration loaded from environment variables."""
@@ -11,11 +16,18 @@ class Settings(BaseSettings):
     # Database Configuration
     database_url: str
     alembic_db_url: str
+    # Per-process pool; keep workers * (size + overflow) under Postgres max_connections
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    # Create tables with SQLModel on startup; normally Alembic owns the schema
+    run_db_init: bool = False
 
     # GCP Configuration
     gcp_project_id: str
     gcp_pubsub_topic: str
     gcp_pubsub_subscription: str
+    # Seconds post_task waits on a publish while holding its flushed transaction
+    pubsub_publish_timeout: float = 5.0
     google_application_credentials: Optional[str] = None
 
     class Config:
@@ -1,5 +0,0 @@
-import uuid
-
-
-def generate_uuid():
-    return str(uuid.uuid4())